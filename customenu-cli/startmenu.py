@@ -7,13 +7,16 @@ import sys
 import time
 import json
 import shlex
+import shutil
 import curses
 import subprocess
-import datetime
+import functools
+import threading
 
 BASE_DIR = os.path.expanduser("~/.config/customenu-cli")
 MENU_FILE = os.path.join(BASE_DIR, "menu.json")
 HEADER_FILE = os.path.join(BASE_DIR, "header.txt")
+WEATHER_CACHE = os.path.join(BASE_DIR, "weather.cache")
 
 os.makedirs(BASE_DIR, exist_ok=True)
 
@@ -33,24 +36,29 @@ if not os.path.exists(MENU_FILE):
 with open(MENU_FILE, "r", encoding="utf-8") as f:
     MENU = json.load(f).get("menu", DEFAULT_MENU["menu"])
 
-BREW_SUB = [
-    {"label": "Brew update", "cmd": "bash -lc 'brew update; read -p \"Enter\"'"},
-    {"label": "Brew upgrade", "cmd": "bash -lc 'brew upgrade; read -p \"Enter\"'"},
-    {"label": "Brew list installed", "cmd": "bash -lc 'brew list; read -p \"Enter\"'"},
-    {"label": "Brew search (type name)", "cmd": "brew_search"},
-    {"label": "Brew info (type name)", "cmd": "brew_info"},
-    {"label": "Back", "cmd": "back"}
-]
-
-EXTRAS_ITEMS = [
-    {"label": "System info (macchina)", "cmd": "bash -lc 'macchina || uname -a; read -p \"Enter\"'"},
-    {"label": "Finder -> yazi", "cmd": "bash -lc 'yazi || echo \"yazi not found\"; read -p \"Enter\"'"},
-    {"label": "Brew …", "cmd": "brewmenu"},
-    {"label": "---", "cmd": None},
-    {"label": "Matrix", "cmd": "bash -lc 'echo Custom A; read -p \"Enter\"'"},
-    {"label": "Spotify", "cmd": "bash -lc 'echo Custom B; read -p \"Enter\"'"},
-    {"label": "Back", "cmd": "back"}
-]
+# submenus and header are only built when first needed
+@functools.lru_cache(maxsize=1)
+def get_brew_sub():
+    return [
+        {"label": "Brew update", "cmd": "bash -lc 'brew update; read -p \"Enter\"'"},
+        {"label": "Brew upgrade", "cmd": "bash -lc 'brew upgrade; read -p \"Enter\"'"},
+        {"label": "Brew list installed", "cmd": "bash -lc 'brew list; read -p \"Enter\"'"},
+        {"label": "Brew search (type name)", "cmd": "brew_search"},
+        {"label": "Brew info (type name)", "cmd": "brew_info"},
+        {"label": "Back", "cmd": "back"}
+    ]
+
+@functools.lru_cache(maxsize=1)
+def get_extras_items():
+    return [
+        {"label": "System info (macchina)", "cmd": "bash -lc 'macchina || uname -a; read -p \"Enter\"'"},
+        {"label": "Finder -> yazi", "cmd": "bash -lc 'yazi || echo \"yazi not found\"; read -p \"Enter\"'"},
+        {"label": "Brew …", "cmd": "brewmenu"},
+        {"label": "---", "cmd": None},
+        {"label": "Matrix", "cmd": "bash -lc 'echo Custom A; read -p \"Enter\"'"},
+        {"label": "Spotify", "cmd": "bash -lc 'echo Custom B; read -p \"Enter\"'"},
+        {"label": "Back", "cmd": "back"}
+    ]
 
 def load_header():
     if os.path.exists(HEADER_FILE):
@@ -58,22 +66,50 @@ def load_header():
             return [ln.rstrip("\n") for ln in f.readlines()]
     return ["WELCOME"]
 
-HEADER = load_header()
+@functools.lru_cache(maxsize=1)
+def get_header():
+    # a tuple, so it can key header_layout's cache
+    return tuple(load_header())
+
+# the header only moves when the terminal width changes
+@functools.lru_cache(maxsize=8)
+def header_layout(w, header_lines):
+    return [(center_x(w, ln), ln) for ln in header_lines]
+
+_LAZY = {"HEADER": get_header, "BREW_SUB": get_brew_sub, "EXTRAS_ITEMS": get_extras_items}
+
+def __getattr__(name):
+    if name in _LAZY:
+        return _LAZY[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 ICON_MAP = {"Ctrl": "⌃", "Cmd": "⌘", "Alt": "⌥", "Opt": "⌥", "Shift": "⇧", "Space": "␣"}
+@functools.lru_cache(maxsize=128)
 def iconify_shortcut(s):
     parts = [p.strip() for p in s.split("+")]
-    return " ".join(ICON_MAP.get(p, p) for p in parts)
+    return " ".join(map(ICON_MAP.get, parts, parts))
+
+# shortcuts are static, so iconify them once instead of on every redraw
+for _it in MENU:
+    _it["_shortcut_icon"] = iconify_shortcut(_it.get("shortcut", ""))
 
 def center_x(w, text):
     return max(0, (w - len(text)) // 2)
 
+NODENAME = os.uname().nodename
+
+# host name and OS version don't change while the menu is open
+@functools.lru_cache(maxsize=1)
 def get_system_info():
-    try:
-        host = subprocess.run(["scutil", "--get", "ComputerName"], capture_output=True, text=True, timeout=0.6)
-        host_name = host.stdout.strip() or os.uname().nodename
-    except Exception:
-        host_name = os.uname().nodename
+    host_name = NODENAME
+    # the friendly ComputerName almost always matches the node name, so only
+    # pay for the scutil fork+exec when asked to
+    if os.environ.get("CUSTOMENU_USE_SCUTIL") == "1":
+        try:
+            host = subprocess.run(["scutil", "--get", "ComputerName"], capture_output=True, text=True, timeout=0.6)
+            host_name = host.stdout.strip() or NODENAME
+        except Exception:
+            pass
 
     try:
         ver = subprocess.run(["sw_vers", "-productVersion"], capture_output=True, text=True, timeout=0.6)
@@ -83,19 +119,104 @@ def get_system_info():
 
     return host_name, os_ver
 
+WEATHER_URL = "https://wttr.in/?format=%c+%t"
+
 def get_weather(timeout_s=1.0):
+    # imported here: http.client pulls in ssl/email, which would otherwise
+    # delay the first draw; this only ever runs on the weather thread
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    req = urllib.request.Request(WEATHER_URL, headers={"User-Agent": "customenu"})
     try:
-        p = subprocess.run(
-            ["curl", "-s", "--max-time", str(timeout_s), "https://wttr.in/?format=%c+%t"],
-            capture_output=True, text=True
-        )
-        return p.stdout.strip()
-    except Exception:
+        with urllib.request.urlopen(req, timeout=timeout_s) as r:
+            return r.read().decode("utf-8", errors="ignore").strip()
+    except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError):
         return ""
 
+# weather is fetched by a daemon thread so the UI never waits on the network;
+# the draw path only ever reads the last known value
+WEATHER_INTERVAL = 300
+WEATHER_RETRY = 30
+WEATHER_MAX_AGE = 900
+_weather = {"value": "", "next_due": 0.0}
+_weather_lock = threading.Lock()
+
+def load_weather_cache():
+    # last run's value is shown straight away; if it is older than
+    # WEATHER_MAX_AGE the thread refreshes it right after startup
+    try:
+        with open(WEATHER_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        value, fetched = cached["value"], float(cached["time"])
+    except Exception:
+        return
+    if not isinstance(value, str):
+        return
+    with _weather_lock:
+        _weather["value"] = value
+        # a timestamp from the future (clock skew, copied cache) must not
+        # postpone the refresh
+        _weather["next_due"] = min(fetched, time.time()) + WEATHER_MAX_AGE
+
+def save_weather_cache(value):
+    try:
+        with open(WEATHER_CACHE, "w", encoding="utf-8") as f:
+            json.dump({"time": time.time(), "value": value}, f)
+    except OSError:
+        pass
+
+def current_weather():
+    with _weather_lock:
+        return _weather["value"]
+
+def _weather_loop():
+    while True:
+        with _weather_lock:
+            delay = _weather["next_due"] - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        value = get_weather()
+        with _weather_lock:
+            if value:
+                _weather["value"] = value
+                _weather["next_due"] = time.time() + WEATHER_INTERVAL
+            else:
+                _weather["next_due"] = time.time() + WEATHER_RETRY
+        if value:
+            save_weather_cache(value)
+
+def start_weather_thread():
+    load_weather_cache()
+    t = threading.Thread(target=_weather_loop, name="weather", daemon=True)
+    t.start()
+    return t
+
+# the clock only shows minutes, so format it once per minute
+_clock = {"minute": -1, "text": ""}
+
+def clock_text():
+    t = time.time()
+    m = int(t // 60)
+    if m != _clock["minute"]:
+        _clock.update(minute=m, text=time.strftime("%H:%M", time.localtime(t)))
+    return _clock["text"]
+
 # ------------ CLEAN STATUS BAR (NO CAPSULES, NO CPU/MEM, NO BACKGROUND) ----------
-def draw_status(stdscr, left_text, weather, clock):
-    h, w = stdscr.getmaxyx()
+_last_bar = None
+# (h, w) as of the last draw_full; refreshed on KEY_RESIZE
+_term_size = (24, 80)
+
+def draw_status(stdscr, left_text, weather, clock, force=False):
+    global _last_bar
+    h, w = _term_size
+
+    # skip the write entirely if the bar on screen already shows this
+    state = (left_text, weather, clock, h, w)
+    if not force and state == _last_bar:
+        return False
+    _last_bar = state
 
     right = f"{weather}   {clock}".strip()
 
@@ -107,28 +228,47 @@ def draw_status(stdscr, left_text, weather, clock):
     bar = left_text + (" " * space) + right
 
     try:
-        stdscr.addstr(h - 1, 0, bar[:w - 1])
+        stdscr.addnstr(h - 1, 0, bar, max(0, w - 1))
     except curses.error:
         pass
+    return True
 
 # -----------------------------------------------------------------------------
 
+def menu_row(it, left_col, right_col):
+    # label padded out to the shortcut column, so a row is a single write
+    gap = right_col - left_col
+    return it.get("label", "").ljust(gap)[:gap] + it.get("_shortcut_icon", "")
+
+# what draw_full last put on screen: {"size": (h, w), "rows": {y: (x, text, attr)}}
+_shadow = None
+
+def _put_row(stdscr, y, row, w):
+    try:
+        stdscr.move(y, 0)
+        stdscr.clrtoeol()
+        if row is not None:
+            x, text, attr = row
+            stdscr.addnstr(y, x, text, max(0, w - x - 1), attr)
+    except curses.error:
+        pass
+
 def draw_full(stdscr, header_lines, menu_items, selected):
-    stdscr.erase()
-    h, w = stdscr.getmaxyx()
+    global _shadow, _term_size
+    # full redraws happen on startup, resize and return from a popup or
+    # command, so this is the one place the size is re-read
+    _term_size = h, w = stdscr.getmaxyx()
 
     header_h = len(header_lines)
     menu_h = len(menu_items)
     total_h = header_h + 2 + menu_h
     start_y = max(1, (h - total_h) // 2)
 
-    for i, ln in enumerate(header_lines):
+    rows = {}
+    for i, (x, ln) in enumerate(header_layout(w, tuple(header_lines))):
         y = start_y + i
         if 0 <= y < h - 1:
-            try:
-                stdscr.addstr(y, center_x(w, ln), ln)
-            except curses.error:
-                pass
+            rows[y] = (x, ln, 0)
 
     mid = w // 2
     left_col = mid - 20
@@ -136,57 +276,106 @@ def draw_full(stdscr, header_lines, menu_items, selected):
 
     for i, it in enumerate(menu_items):
         y = start_y + header_h + 2 + i
-        label = it.get("label", "")
-        shortcut = iconify_shortcut(it.get("shortcut", ""))
         if 0 <= y < h - 1:
-            try:
-                if i == selected:
-                    stdscr.attron(curses.A_REVERSE)
-                stdscr.addstr(y, left_col, label[:max(0, w - left_col - 1)])
-                stdscr.addstr(y, right_col, shortcut[:max(0, w - right_col - 1)])
-                if i == selected:
-                    stdscr.attroff(curses.A_REVERSE)
-            except curses.error:
-                pass
+            attr = curses.A_REVERSE if i == selected else 0
+            rows[y] = (left_col, menu_row(it, left_col, right_col), attr)
+
+    # only rewrite rows that differ from the previous frame. The screen is
+    # erased just once; after a resize every old row (and the old status bar)
+    # is treated as stale and cleared on its own instead
+    if _shadow is None:
+        stdscr.erase()
+        old_rows = {}
+    elif _shadow["size"] != (h, w):
+        stale = _shadow["rows"].keys() | {_shadow["size"][0] - 1}
+        old_rows = {y: None for y in stale if y < h}
+        for y in old_rows:
+            _put_row(stdscr, y, None, w)
+    else:
+        old_rows = _shadow["rows"]
+    for y in rows.keys() | old_rows.keys():
+        if rows.get(y) != old_rows.get(y):
+            _put_row(stdscr, y, rows.get(y), w)
+    _shadow = {"size": (h, w), "rows": rows}
 
     host, osver = get_system_info()
     left_status = f"{host} • {osver}"
-    weather = get_weather()
-    now = datetime.datetime.now().strftime("%H:%M")
-    draw_status(stdscr, left_status, weather, now)
-
-    stdscr.refresh()
+    weather = current_weather()
+    now = clock_text()
+    draw_status(stdscr, left_status, weather, now, force=True)
+
+    # popups draw over stdscr without touching it, so let ncurses compare
+    # every line against the physical screen; it still only emits the damage
+    stdscr.touchwin()
+    stdscr.noutrefresh()
+    curses.doupdate()
     return start_y
 
 def update_selection(stdscr, header_lines, menu_items, prev, cur):
-    h, w = stdscr.getmaxyx()
+    if prev == cur:
+        return
+    h, w = _term_size
     header_h = len(header_lines)
     base = max(1, (h - (header_h + 2 + len(menu_items))) // 2) + header_h + 2
     mid = w // 2
     left_col = mid - 20
     right_col = mid + 16
 
-    for row, idx in [(prev, prev), (cur, cur)]:
+    for idx in (prev, cur):
         if 0 <= idx < len(menu_items):
             y = base + idx
-            label = menu_items[idx].get("label", "")
-            shortcut = iconify_shortcut(menu_items[idx].get("shortcut", ""))
-            try:
-                if idx == cur:
-                    stdscr.attron(curses.A_REVERSE)
-                stdscr.addstr(y, left_col, " " * (w - left_col - 1))
-                stdscr.addstr(y, left_col, label[:max(0, w - left_col - 1)])
-                stdscr.addstr(y, right_col, shortcut[:max(0, w - right_col - 1)])
-                if idx == cur:
-                    stdscr.attroff(curses.A_REVERSE)
-            except curses.error:
-                pass
+            # same bound as draw_full: never write over the status bar
+            if not 0 <= y < h - 1:
+                continue
+            attr = curses.A_REVERSE if idx == cur else 0
+            row = (left_col, menu_row(menu_items[idx], left_col, right_col), attr)
+            _put_row(stdscr, y, row, w)
+            if _shadow is not None and y in _shadow["rows"]:
+                _shadow["rows"][y] = row
 
     stdscr.refresh()
 
 # ---------------- popups unchanged ----------------
 # (all popup code stays the same – no display background changes needed)
 
+# characters that need a real shell; commands without them are exec'd directly
+SHELL_CHARS = set("|&;<>()$`\\\"'*?[]#~{}!\n")
+
+@functools.lru_cache(maxsize=64)
+def command_argv(cmd):
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return ("/bin/sh", "-c", cmd)
+    # "bash -lc '...'" already brings its own shell, skip the sh -c wrapper,
+    # but only when the body is a single quoted word sh would pass through as-is
+    if len(argv) == 3 and argv[:2] == ["bash", "-lc"]:
+        body = argv[2]
+        if cmd == "bash -lc " + shlex.quote(body) or ("'" not in body and cmd == f"bash -lc '{body}'"):
+            return tuple(argv)
+    # builtins like exec/cd aren't on PATH and need sh to run them
+    if (argv and "=" not in argv[0] and not SHELL_CHARS.intersection(cmd)
+            and shutil.which(argv[0]) is not None):
+        return tuple(argv)
+    return ("/bin/sh", "-c", cmd)
+
+def run_command(cmd):
+    if not cmd:
+        return
+    argv = cmd if isinstance(cmd, (list, tuple)) else command_argv(cmd)
+    try:
+        p = subprocess.Popen(argv)
+    except OSError as e:
+        print(f"{argv[0]}: {e.strerror or e}", file=sys.stderr)
+        return
+    # waitpid releases the GIL, so the weather thread keeps running meanwhile
+    try:
+        p.wait()
+    except BaseException:
+        p.kill()
+        p.wait()
+        raise
+
 def prompt_input_shell(prompt="pkg"):
     curses.endwin()
     try:
@@ -201,104 +390,106 @@ def brew_search_flow():
     if not name:
         return
     curses.endwin()
-    subprocess.run(f"bash -lc 'brew search {shlex.quote(name)}; read -p \"Enter\"'", shell=True)
+    run_command(["bash", "-lc", f"brew search {shlex.quote(name)}; read -p Enter"])
 
 def brew_info_flow():
     name = prompt_input_shell("Brew info for")
     if not name:
         return
     curses.endwin()
-    subprocess.run(f"bash -lc 'brew info {shlex.quote(name)}; read -p \"Enter\"'", shell=True)
+    run_command(["bash", "-lc", f"brew info {shlex.quote(name)}; read -p Enter"])
+
+# key code -> action; -1 is what getch returns when its timeout expires
+NAV_KEYS = {
+    curses.KEY_UP: "up", ord("k"): "up",
+    curses.KEY_DOWN: "down", ord("j"): "down",
+    10: "enter", 13: "enter",
+    27: "quit",
+}
+MENU_KEYS = {**NAV_KEYS, -1: "tick", curses.KEY_RESIZE: "resize"}
+POPUP_KEYS = {**NAV_KEYS, ord("q"): "quit", curses.KEY_RESIZE: "resize"}
 
-def extras_menu_flow(stdscr):
-    items = EXTRAS_ITEMS[:]
+def draw_popup_row(win, ph, pw, items, i, selected):
+    y = 3 + i
+    if y >= ph - 1:
+        return
+    attr = curses.A_REVERSE if i == selected else 0
+    try:
+        win.addnstr(y, 2, items[i].get("label", ""), max(0, pw - 4), attr)
+    except curses.error:
+        pass
+
+def open_popup(stdscr, title, items, selected):
+    # the window and its frame are drawn once; key presses only touch the
+    # rows whose highlight changed
+    h, w = stdscr.getmaxyx()
+    ph = min(len(items) + 4, h - 6)
+    pw = min(56, w - 8)
+    py = (h - ph) // 2
+    px = (w - pw) // 2
+    win = curses.newwin(ph, pw, py, px)
+    win.keypad(True)
+    win.box()
+    try:
+        win.addstr(1, center_x(pw, title), title, curses.A_BOLD)
+    except curses.error:
+        pass
+    for i in range(len(items)):
+        draw_popup_row(win, ph, pw, items, i, selected)
+    win.refresh()
+    return win, ph, pw
+
+def extras_menu_flow(stdscr, redraw):
+    # redraw() repaints the main menu underneath, used when the terminal resizes
+    items = get_extras_items()[:]
     idx = 0
+    win, ph, pw = open_popup(stdscr, "Extras", items, idx)
     while True:
-        h, w = stdscr.getmaxyx()
-        ph = min(len(items) + 4, h - 6)
-        pw = min(56, w - 8)
-        py = (h - ph) // 2
-        px = (w - pw) // 2
-        win = curses.newwin(ph, pw, py, px)
-        win.keypad(True)
-        win.erase()
-        win.box()
-        title = "Extras"
-        try:
-            win.addstr(1, center_x(pw, title), title, curses.A_BOLD)
-        except curses.error:
-            pass
-
-        for i, it in enumerate(items):
-            y = 3 + i
-            if y >= ph - 1:
-                break
-            lbl = it.get("label", "")
-            if i == idx:
-                win.attron(curses.A_REVERSE)
-                win.addstr(y, 2, lbl[:pw-4])
-                win.attroff(curses.A_REVERSE)
-            else:
-                win.addstr(y, 2, lbl[:pw-4])
-        win.refresh()
-
-        key = win.getch()
-        if key in (curses.KEY_UP, ord("k")):
+        prev = idx
+        action = POPUP_KEYS.get(win.getch())
+        if action is None:
+            continue
+        if action == "up":
             idx = (idx - 1) % len(items)
-        elif key in (curses.KEY_DOWN, ord("j")):
+        elif action == "down":
             idx = (idx + 1) % len(items)
-        elif key in (10, 13):
+        elif action == "enter":
             cmd = items[idx].get("cmd")
             if cmd == "back":
                 return
             if cmd == "brewmenu":
-                brew_submenu_flow(stdscr)
+                brew_submenu_flow(stdscr, redraw)
                 return
             curses.endwin()
-            subprocess.run(cmd, shell=True)
+            run_command(cmd)
             stdscr = curses.initscr()
             return
-        elif key in (27, ord("q")):
+        elif action == "resize":
+            # re-centre the popup for the new size on top of a fresh menu
+            redraw()
+            win, ph, pw = open_popup(stdscr, "Extras", items, idx)
+        elif action == "quit":
             return
 
-def brew_submenu_flow(stdscr):
-    items = BREW_SUB
+        if idx != prev:
+            draw_popup_row(win, ph, pw, items, prev, idx)
+            draw_popup_row(win, ph, pw, items, idx, idx)
+            win.refresh()
+
+def brew_submenu_flow(stdscr, redraw):
+    items = get_brew_sub()
     idx = 0
+    win, ph, pw = open_popup(stdscr, "Homebrew", items, idx)
     while True:
-        h, w = stdscr.getmaxyx()
-        ph = min(len(items) + 4, h - 6)
-        pw = min(56, w - 8)
-        py = (h - ph) // 2
-        px = (w - pw) // 2
-        win = curses.newwin(ph, pw, py, px)
-        win.keypad(True)
-        win.erase()
-        win.box()
-        title = "Homebrew"
-        try:
-            win.addstr(1, center_x(pw, title), title, curses.A_BOLD)
-        except curses.error:
-            pass
-
-        for i, it in enumerate(items):
-            y = 3 + i
-            if y >= ph - 1:
-                break
-            lbl = it.get("label", "")
-            if i == idx:
-                win.attron(curses.A_REVERSE)
-                win.addstr(y, 2, lbl[:pw-4])
-                win.attroff(curses.A_REVERSE)
-            else:
-                win.addstr(y, 2, lbl[:pw-4])
-        win.refresh()
-
-        key = win.getch()
-        if key in (curses.KEY_UP, ord("k")):
+        prev = idx
+        action = POPUP_KEYS.get(win.getch())
+        if action is None:
+            continue
+        if action == "up":
             idx = (idx - 1) % len(items)
-        elif key in (curses.KEY_DOWN, ord("j")):
+        elif action == "down":
             idx = (idx + 1) % len(items)
-        elif key in (10, 13):
+        elif action == "enter":
             cmd = items[idx].get("cmd")
             if cmd == "back":
                 return
@@ -309,57 +500,72 @@ def brew_submenu_flow(stdscr):
                 brew_info_flow()
                 return
             curses.endwin()
-            subprocess.run(cmd, shell=True)
+            run_command(cmd)
             stdscr = curses.initscr()
             return
-        elif key in (27, ord("q")):
+        elif action == "resize":
+            # re-centre the popup for the new size on top of a fresh menu
+            redraw()
+            win, ph, pw = open_popup(stdscr, "Homebrew", items, idx)
+        elif action == "quit":
             return
 
+        if idx != prev:
+            draw_popup_row(win, ph, pw, items, prev, idx)
+            draw_popup_row(win, ph, pw, items, idx, idx)
+            win.refresh()
+
 def main(stdscr):
     curses.curs_set(0)
     stdscr.keypad(True)
+    # getch returns -1 after a second without input, which drives the status refresh
+    stdscr.timeout(1000)
     curses.use_default_colors()
+    start_weather_thread()
 
+    host, osver = get_system_info()
+    left_status = f"{host} • {osver}"
+
+    header = get_header()
     selected = 0
     prev = 0
 
-    draw_full(stdscr, HEADER, MENU, selected)
-    last_refresh = time.time()
-    refresh_interval = 3
+    draw_full(stdscr, header, MENU, selected)
 
     while True:
-        if time.time() - last_refresh > refresh_interval:
-            host, osver = get_system_info()
-            left_status = f"{host} • {osver}"
-            weather = get_weather()
-            now = datetime.datetime.now().strftime("%H:%M")
-            draw_status(stdscr, left_status, weather, now)
-            last_refresh = time.time()
-
-        key = stdscr.getch()
-
-        if key in (curses.KEY_UP, ord("k")):
+        action = MENU_KEYS.get(stdscr.getch())
+        if action is None:
+            continue
+
+        if action == "tick":
+            weather = current_weather()
+            now = clock_text()
+            if draw_status(stdscr, left_status, weather, now):
+                stdscr.refresh()
+        elif action == "up":
             prev = selected
             selected = (selected - 1) % len(MENU)
-            update_selection(stdscr, HEADER, MENU, prev, selected)
-        elif key in (curses.KEY_DOWN, ord("j")):
+            update_selection(stdscr, header, MENU, prev, selected)
+        elif action == "down":
             prev = selected
             selected = (selected + 1) % len(MENU)
-            update_selection(stdscr, HEADER, MENU, prev, selected)
-        elif key in (10, 13):
+            update_selection(stdscr, header, MENU, prev, selected)
+        elif action == "enter":
             cmd = MENU[selected].get("cmd", "")
             if cmd == "shell":
                 return
             if cmd == "popup":
-                extras_menu_flow(stdscr)
-                draw_full(stdscr, HEADER, MENU, selected)
+                extras_menu_flow(stdscr, lambda: draw_full(stdscr, header, MENU, selected))
+                draw_full(stdscr, header, MENU, selected)
             else:
                 curses.endwin()
-                subprocess.run(cmd, shell=True)
+                run_command(cmd)
                 stdscr = curses.initscr()
                 stdscr.keypad(True)
-                draw_full(stdscr, HEADER, MENU, selected)
-        elif key in (27,):
+                draw_full(stdscr, header, MENU, selected)
+        elif action == "resize":
+            draw_full(stdscr, header, MENU, selected)
+        elif action == "quit":
             return
 
 if __name__ == "__main__":